@@ -6,7 +6,11 @@ import math
 import mysql.connector
 from mysql.connector import Error
 
+from assets import init_assets
+from build_assets import build as build_assets
+
 app = Flask(__name__)
+init_assets(app)
 
 # Konfigurasi database MySQL
 DB_CONFIG = {
@@ -363,5 +367,10 @@ def add_production():
             connection.close()
 
 if __name__ == '__main__':
+    # The debug reloader runs this block again in its child process; build once
+    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        print("Building static assets...")
+        if build_assets() != 0:
+            raise SystemExit("Static asset build failed, see the messages above")
     print("Starting Flask app with MySQL...")
     app.run(debug=True)
@@ -4,7 +4,11 @@ import os
 from datetime import datetime, timedelta
 import math
 
+from assets import init_assets
+from build_assets import build as build_assets
+
 app = Flask(__name__)
+init_assets(app)
 
 # Data storage files
 DATA_DIR = 'data'
@@ -290,5 +294,10 @@ def add_production():
 if __name__ == '__main__':
     print("Initializing data files...")
     init_data_files()
+    # The debug reloader runs this block again in its child process; build once
+    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        print("Building static assets...")
+        if build_assets() != 0:
+            raise SystemExit("Static asset build failed, see the messages above")
     print("Starting Flask app...")
     app.run(debug=True)
@@ -0,0 +1,94 @@
+from flask import abort, request, send_from_directory, url_for
+import json
+import mimetypes
+import os
+
+# Bundles built by build_assets.py, listed as source files relative to static/.
+# Order matters: vendor libraries first, then our own CSS/JS.
+BUNDLES = {
+    'app.css': [
+        'vendor/bootstrap/css/bootstrap.min.css',
+        'vendor/fontawesome/css/fontawesome.min.css',
+        'vendor/fontawesome/css/solid.min.css',
+        'css/style.css'
+    ],
+    'app.js': [
+        'vendor/bootstrap/js/bootstrap.bundle.min.js',
+        'vendor/chart.js/chart.umd.js',
+        'js/script.js'
+    ]
+}
+
+# Build output directory (inside static/) and its manifest
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# Precompressed variants in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Hashed filenames never change content, so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Load bundle name -> hashed filename mapping written by build_assets.py
+def load_manifest(dist_path):
+    try:
+        with open(os.path.join(dist_path, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+# Register the /assets route and the asset_urls template helper
+def init_assets(app):
+    dist_path = os.path.join(app.static_folder, DIST_DIR)
+    manifest_path = os.path.join(dist_path, MANIFEST_NAME)
+    state = {'manifest': {}, 'version': None, 'reported_missing': False}
+
+    def get_manifest():
+        # Reload whenever build_assets.py swaps in a new manifest, so rebuilds
+        # are picked up without restarting the server
+        try:
+            stat = os.stat(manifest_path)
+            version = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            version = None
+        if version != state['version']:
+            state['manifest'] = load_manifest(dist_path)
+            state['version'] = version
+
+        # Outside debug an unbuilt app only gets uncached, unbundled files
+        if not state['manifest'] and not app.debug and not state['reported_missing']:
+            app.logger.error("%s not found: run `python build_assets.py` before starting the app. "
+                             "Serving unbundled files from /static/ until it exists.",
+                             manifest_path)
+            state['reported_missing'] = True
+        return state['manifest']
+
+    def asset_urls(bundle):
+        hashed_name = get_manifest().get(bundle)
+        if hashed_name:
+            return [url_for('assets', filename=hashed_name)]
+        # Not built yet: serve the unbundled sources through the normal static route
+        return [url_for('static', filename=source) for source in BUNDLES[bundle]]
+
+    def serve_asset(filename):
+        if filename == MANIFEST_NAME:
+            abort(404)
+
+        response = None
+        for encoding, suffix in ENCODINGS:
+            if request.accept_encodings[encoding] and os.path.isfile(os.path.join(dist_path, filename + suffix)):
+                mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+                response = send_from_directory(dist_path, filename + suffix, mimetype=mimetype,
+                                               download_name=filename)
+                response.headers['Content-Encoding'] = encoding
+                break
+
+        if response is None:
+            response = send_from_directory(dist_path, filename)
+
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+    app.add_url_rule('/assets/<path:filename>', 'assets', serve_asset)
+    app.jinja_env.globals['asset_urls'] = asset_urls
@@ -0,0 +1,313 @@
+"""Build fingerprinted static bundles for the manufacturing app.
+
+Usage:
+    python build_assets.py --fetch   # re-download pinned vendor libraries into static/vendor
+    python build_assets.py           # bundle, hash and precompress into static/dist
+    python build_assets.py --clean   # same, then delete outputs the new manifest no longer uses
+
+static/vendor is committed so plant-floor terminals never depend on a public
+CDN. static/dist is not: run `python build_assets.py` as a deploy step before
+starting the app (e.g. before `gunicorn app:app`); `python app.py` runs it on
+startup. The output is served by assets.py under /assets/ with immutable
+caching; the filenames change whenever the content does.
+
+A build never deletes earlier outputs, so running servers, workers mid-restart
+and pages rendered before a deploy keep resolving their old hashed URLs. The
+manifest is replaced last and atomically. Use --clean once nothing can still
+reference the previous build.
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import urllib.request
+import zipfile
+
+from assets import BUNDLES, DIST_DIR, MANIFEST_NAME
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = 'static'
+VENDOR_DIR = os.path.join(STATIC_DIR, 'vendor')
+
+# PyPI wheels that ship the upstream builds. PyPI never replaces a published
+# file, and every extracted file is checked against the SHA-256 below.
+BOOTSTRAP_WHEEL = 'https://files.pythonhosted.org/packages/12/3a/3971e2a28ae9076be3ecf99086b7ceef12111920b03fc095d749eab30714/django_bootstrap_static-5.3.3-py3-none-any.whl'
+CHARTJS_WHEEL = 'https://files.pythonhosted.org/packages/cb/e8/2591119368628867284550ee5c337bae1f4b4c0e5a8a59f231899326a26f/django_unfold-0.91.0-py3-none-any.whl'
+FONTAWESOME_WHEEL = 'https://files.pythonhosted.org/packages/8f/fc/295f4f71fc157de68dcf25a4850953e61f6eca644e7416f10a281ed42441/fontawesomefree-6.5.1-py3-none-any.whl'
+
+# Pinned vendor libraries: path inside static/vendor -> (wheel URL, path inside the wheel, SHA-256)
+VENDOR_FILES = {
+    # Bootstrap 5.3.3
+    'bootstrap/css/bootstrap.min.css': (
+        BOOTSTRAP_WHEEL, 'bootstrap/static/bootstrap/css/bootstrap.min.css',
+        '3c8f27e6009ccfd710a905e6dcf12d0ee3c6f2ac7da05b0572d3e0d12e736fc8'),
+    'bootstrap/js/bootstrap.bundle.min.js': (
+        BOOTSTRAP_WHEEL, 'bootstrap/static/bootstrap/js/bootstrap.bundle.min.js',
+        '0833b2e9c3a26c258476c46266e6877fc75218625162e0460be9a3a098a61c6c'),
+    # Chart.js 4.4.0 (UMD build)
+    'chart.js/chart.umd.js': (
+        CHARTJS_WHEEL, 'unfold/static/unfold/js/chart/chart.js',
+        'db65ba70511147e08494c38a46030c89cb9e3153f455fec50440581fc67cb429'),
+    'chart.js/LICENSE': (
+        CHARTJS_WHEEL, 'unfold/static/unfold/js/chart/LICENSE',
+        '41a84aa2caba645f966a18d9c2056b73e6d3a81d80bc0046bc0011a2634d4cce'),
+    # Font Awesome Free 6.5.1 (solid icons only)
+    'fontawesome/css/fontawesome.min.css': (
+        FONTAWESOME_WHEEL, 'fontawesomefree/static/fontawesomefree/css/fontawesome.min.css',
+        '8eb5b44ce5971a501e5a17954c464b80aba0c4604675b5603a7f456459af88a1'),
+    'fontawesome/css/solid.min.css': (
+        FONTAWESOME_WHEEL, 'fontawesomefree/static/fontawesomefree/css/solid.min.css',
+        'b8afa4243dd1bf735f512708da5335b0ed314d9e58a0a1cf1b781250cf5fb004'),
+    'fontawesome/webfonts/fa-solid-900.woff2': (
+        FONTAWESOME_WHEEL, 'fontawesomefree/static/fontawesomefree/webfonts/fa-solid-900.woff2',
+        '9fc85f3a4544ab0d570c7f8f9bbb88db8d92c359b2707580ea8b07c75673eae2'),
+    'fontawesome/webfonts/fa-solid-900.ttf': (
+        FONTAWESOME_WHEEL, 'fontawesomefree/static/fontawesomefree/webfonts/fa-solid-900.ttf',
+        'fbbf06d7437aa30f3cd44c968380193545a8fc3eadfb7ad897bbb101eefec5a2')
+}
+
+# Formats worth precompressing: text and uncompressed fonts like TTF.
+# woff2 is already compressed and is left alone
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.ttf')
+
+HASH_LENGTH = 10
+
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+SOURCE_MAP_PATTERN = re.compile(r'^\s*(//[#@] sourceMappingURL=.*|/\*[#@] sourceMappingURL=.*?\*/)\s*$', re.MULTILINE)
+
+
+# Download vendor libraries, writing nothing unless every checksum matches
+def fetch_vendor_files():
+    wheels = {}
+    files = {}
+    for path, (url, member, expected) in VENDOR_FILES.items():
+        if url not in wheels:
+            print(f"Fetching {url}")
+            with urllib.request.urlopen(url) as response:
+                wheels[url] = zipfile.ZipFile(io.BytesIO(response.read()))
+
+        data = wheels[url].read(member)
+        actual = hashlib.sha256(data).hexdigest()
+        if actual != expected:
+            print(f"Checksum mismatch for static/vendor/{path}: expected {expected}, got {actual}")
+            return 1
+        files[path] = data
+
+    for path, data in files.items():
+        target = os.path.join(VENDOR_DIR, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(data)
+    return 0
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_filename(name, data):
+    base, ext = os.path.splitext(name)
+    return f"{base}.{content_hash(data)}{ext}"
+
+
+# Split CSS into (kind, text) chunks so the minifier never touches string contents
+def tokenize(source):
+    tokens = []
+    i = 0
+    n = len(source)
+    code_start = 0
+
+    while i < n:
+        char = source[i]
+        if char in '"\'':
+            end = i + 1
+            while end < n and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            tokens.append(('code', source[code_start:i]))
+            tokens.append(('string', source[i:end + 1]))
+            i = code_start = end + 1
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            tokens.append(('code', source[code_start:i]))
+            # Keep license banners (/*! ... */), otherwise leave a separator behind
+            if source.startswith('/*!', i):
+                tokens.append(('string', source[i:end]))
+            else:
+                tokens.append(('code', ' '))
+            i = code_start = end
+        else:
+            i += 1
+
+    tokens.append(('code', source[code_start:]))
+
+    # Merge code chunks left around removed comments so whitespace collapses across them
+    merged = []
+    for kind, text in tokens:
+        if merged and kind == 'code' and merged[-1][0] == 'code':
+            merged[-1] = ('code', merged[-1][1] + text)
+        else:
+            merged.append((kind, text))
+    return merged
+
+
+# Strip comments and whitespace from CSS
+def minify_css(source):
+    result = []
+    for kind, text in tokenize(source):
+        if kind == 'code':
+            text = re.sub(r'\s+', ' ', text)
+            text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+            text = re.sub(r':\s+', ':', text)
+            text = text.replace(';}', '}')
+        result.append(text)
+    return ''.join(result).strip()
+
+
+# Copy files referenced by url() into dist with hashed names and point the CSS at them
+def rewrite_css_urls(css, source_path, dist_path, outputs):
+    source_dir = os.path.dirname(source_path)
+
+    def replace(match):
+        url = match.group(2).strip()
+        if url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+
+        path = re.split(r'[?#]', url, maxsplit=1)[0]
+        suffix = url[len(path):]
+        asset_path = os.path.normpath(os.path.join(source_dir, path))
+        with open(asset_path, 'rb') as f:
+            data = f.read()
+
+        name = hashed_filename(os.path.basename(asset_path), data)
+        write_output(dist_path, name, data)
+        outputs.add(name)
+        return f"url({name}{suffix})"
+
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+def build_css(sources, dist_path, outputs):
+    parts = []
+    for source in sources:
+        source_path = os.path.join(STATIC_DIR, source)
+        with open(source_path, 'r', encoding='utf-8') as f:
+            css = f.read()
+        css = SOURCE_MAP_PATTERN.sub('', css)
+        # @charset is only valid at the very start of the bundle
+        css = re.sub(r'@charset\s+"[^"]*";', '', css)
+        if not source.endswith('.min.css'):
+            css = minify_css(css)
+        parts.append(rewrite_css_urls(css, source_path, dist_path, outputs).strip())
+    return '@charset "UTF-8";\n' + '\n'.join(parts) + '\n'
+
+
+def build_js(sources):
+    parts = []
+    for source in sources:
+        with open(os.path.join(STATIC_DIR, source), 'r', encoding='utf-8') as f:
+            js = f.read()
+        # Our own JS is not minified: without a real parser, regex literals can be
+        # mistaken for strings or comments, and gzip/brotli already remove most
+        # of what whitespace stripping would save
+        parts.append(SOURCE_MAP_PATTERN.sub('', js).strip())
+    # Guard against files that do not end with a semicolon
+    return ';\n'.join(parts) + ';\n'
+
+
+# Write through a temp file so a running server never sees a partial file
+def write_file(target, data):
+    temp = target + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, target)
+
+
+# Write a build artifact plus its gzip/brotli variants when they are smaller.
+# Names are content-hashed, so an existing file already has the right content.
+def write_output(dist_path, name, data):
+    target = os.path.join(dist_path, name)
+    if os.path.exists(target):
+        return
+
+    if name.endswith(COMPRESSIBLE_EXTENSIONS):
+        # mtime=0 keeps the .gz output reproducible between builds
+        compressed = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed['.br'] = brotli.compress(data, quality=11)
+
+        for suffix, payload in compressed.items():
+            if len(payload) < len(data):
+                write_file(target + suffix, payload)
+
+    # The plain file goes last: it marks the output as complete for later builds
+    write_file(target, data)
+
+
+# Delete outputs (and their variants) that the current build does not reference
+def prune_outputs(dist_path, outputs):
+    for entry in os.listdir(dist_path):
+        name = entry
+        for suffix in ('.gz', '.br'):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+        if name != MANIFEST_NAME and name not in outputs:
+            os.remove(os.path.join(dist_path, entry))
+            print(f"Removed {entry}")
+
+
+def build(clean=False):
+    missing = [source for sources in BUNDLES.values() for source in sources
+               if not os.path.exists(os.path.join(STATIC_DIR, source))]
+    if missing:
+        print("Missing source files (run with --fetch to restore vendor libraries):")
+        for source in missing:
+            print(f"  static/{source}")
+        return 1
+
+    dist_path = os.path.join(STATIC_DIR, DIST_DIR)
+    os.makedirs(dist_path, exist_ok=True)
+
+    manifest = {}
+    outputs = set()
+    for bundle, sources in BUNDLES.items():
+        if bundle.endswith('.css'):
+            content = build_css(sources, dist_path, outputs)
+        else:
+            content = build_js(sources)
+        data = content.encode('utf-8')
+        manifest[bundle] = hashed_filename(bundle, data)
+        write_output(dist_path, manifest[bundle], data)
+        outputs.add(manifest[bundle])
+        print(f"Built {bundle} -> {manifest[bundle]} ({len(data)} bytes)")
+
+    # Switch servers to the new build only once every file it names exists
+    write_file(os.path.join(dist_path, MANIFEST_NAME), json.dumps(manifest, indent=4).encode('utf-8'))
+
+    if clean:
+        prune_outputs(dist_path, outputs)
+
+    if brotli is None:
+        print("brotli not installed, only gzip variants were written")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build fingerprinted static bundles")
+    parser.add_argument('--fetch', action='store_true', help="download pinned vendor libraries before building")
+    parser.add_argument('--clean', action='store_true', help="delete outputs of earlier builds after building")
+    args = parser.parse_args()
+
+    # Paths are relative to the project root, like the data files in app.py
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    if args.fetch and fetch_vendor_files():
+        sys.exit(1)
+    sys.exit(build(clean=args.clean))